@@ -14,6 +14,7 @@ from botorch.acquisition import AcquisitionFunction as BoAcquisitionFunction
 from botorch.acquisition.monte_carlo import MCAcquisitionObjective
 from botorch.acquisition.objective import PosteriorTransform
 from botorch.models.model import Model
+from botorch.sampling.base import MCSampler
 from botorch.utils.multi_objective.box_decompositions.box_decomposition import (
     BoxDecomposition,
 )
@@ -21,6 +22,7 @@ from torch import Tensor
 
 from baybe.acquisition.acqfs import (
     _ExpectedHypervolumeImprovement,
+    _MonteCarloSamplingMixin,
     qExpectedHypervolumeImprovement,
     qLogExpectedHypervolumeImprovement,
     qNegIntegratedPosteriorVariance,
@@ -79,6 +81,7 @@ class BotorchAcquisitionArgs:
     posterior_transform: PosteriorTransform | None = _OPT_FIELD
     prune_baseline: bool | None = _OPT_FIELD
     ref_point: Tensor | None = _OPT_FIELD
+    sampler: MCSampler | None = _OPT_FIELD
     X_baseline: Tensor | None = _OPT_FIELD
     X_pending: Tensor | None = _OPT_FIELD
 
@@ -118,35 +121,49 @@ class BotorchAcquisitionFunctionBuilder:
         args, _ = match_attributes(
             self.acqf,
             self._botorch_acqf_cls.__init__,
-            ignore=self.acqf._non_botorch_attrs,
+            ignore=(
+                *self.acqf._non_botorch_attrs,
+                # The sampling controls are translated into a sampler object
+                *(f.name for f in fields(_MonteCarloSamplingMixin)),
+            ),
         )
 
         # Pre-populate the acqf arguments with the content of the BayBE acqf
-        self._args = BotorchAcquisitionArgs(model=self.surrogate.to_botorch(), **args)
+        self._args = BotorchAcquisitionArgs(model=self._botorch_surrogate, **args)
 
     @cached_property
     def _botorch_surrogate(self) -> Model:
         """The botorch surrogate object."""
         return self.surrogate.to_botorch()
 
+    @cached_property
+    def _botorch_objective(self) -> MCAcquisitionObjective:
+        """The BoTorch objective object."""
+        return self.objective.to_botorch()
+
     @cached_property
     def _train_x(self) -> pd.DataFrame:
         """The training parameter values."""
         return self.searchspace.transform(self.measurements, allow_extra=True)
 
+    @cached_property
+    def _train_x_tensor(self) -> Tensor:
+        """The training parameter values in tensor representation."""
+        return to_tensor(self._train_x)
+
     @cached_property
     def _posterior_mean_comp(self) -> Tensor:
         """The posterior mean of the (transformed) targets of the training data."""
         # TODO: Currently, this is the "transformed posterior mean of the targets"
         #   rather than the "posterior mean of the transformed targets".
-        posterior = self._botorch_surrogate.posterior(to_tensor(self._train_x))
+        posterior = self._botorch_surrogate.posterior(self._train_x_tensor)
         if not hasattr(posterior, "mean"):
             raise IncompatibilityError(
                 f"The used surrogate model of type "
                 f"'{type(self._botorch_surrogate).__name__}' "
                 f"does not provide a posterior mean."
             )
-        return self.objective.to_botorch()(posterior.mean)
+        return self._botorch_objective(posterior.mean)
 
     @cached_property
     def _target_configurations(self) -> pd.DataFrame:
@@ -187,6 +204,7 @@ class BotorchAcquisitionFunctionBuilder:
         self._set_target_transformation()
         self._set_X_baseline()
         self._set_X_pending()
+        self._set_sampler()
         self._set_mc_points()
         self._set_ref_point()
         self._set_partitioning()
@@ -256,7 +274,7 @@ class BotorchAcquisitionFunctionBuilder:
                 else:
                     return
 
-            self._args.objective = self.objective.to_botorch()
+            self._args.objective = self._botorch_objective
 
     def _set_best_f(self) -> None:
         """Set BoTorch's ``best_f`` argument."""
@@ -278,6 +296,33 @@ class BotorchAcquisitionFunctionBuilder:
         assert hasattr(acqf, "_default_sample_shape")
         acqf._default_sample_shape = torch.Size([self.acqf.n_mc_samples])  # type: ignore[assignment]
 
+    def _set_sampler(self) -> None:
+        """Set BoTorch's ``sampler`` argument."""
+        if flds.sampler.name not in self._signature:
+            return
+
+        # Thompson sampling controls its sample shape via its own mechanism
+        if isinstance(self.acqf, qThompsonSampling):
+            return
+
+        if not isinstance(self.acqf, _MonteCarloSamplingMixin):
+            return
+
+        if (self.acqf.n_mc_samples is None) and (self.acqf.sampler_seed is None):
+            # Without explicit sampling controls, BoTorch's lazily created
+            # default sampler is used
+            return
+
+        from botorch.sampling.normal import SobolQMCNormalSampler
+
+        # The sample size falls back to BoTorch's default when only a seed is given
+        n_mc_samples = self.acqf.n_mc_samples or 512
+
+        self._args.sampler = SobolQMCNormalSampler(
+            sample_shape=torch.Size([n_mc_samples]),
+            seed=self.acqf.sampler_seed,
+        )
+
     def _set_mc_points(self) -> None:
         """Set BoTorch's ``mc_points`` argument."""
         if flds.mc_points.name not in self._signature:
@@ -316,7 +361,7 @@ class BotorchAcquisitionFunctionBuilder:
             kwargs = {} if ref_point is None else {"factor": ref_point}
             self._args.ref_point = to_tensor(
                 self.acqf.compute_ref_point(
-                    self.objective.to_botorch()(to_tensor(self._target_configurations)),
+                    self._botorch_objective(to_tensor(self._target_configurations)),
                     **kwargs,
                 )
             )
@@ -326,7 +371,7 @@ class BotorchAcquisitionFunctionBuilder:
         if flds.X_baseline.name not in self._signature:
             return
 
-        self._args.X_baseline = to_tensor(self._train_x)
+        self._args.X_baseline = self._train_x_tensor
 
     def _set_X_pending(self) -> None:
         """Set BoTorch's ``X_pending`` argument."""
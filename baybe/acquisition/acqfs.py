@@ -23,6 +23,34 @@ from baybe.utils.sampling_algorithms import DiscreteSamplingMethod, sample_numer
 from baybe.utils.validation import finite_float
 
 
+########################################################################################
+### Monte Carlo Sampling
+@define(frozen=True)
+class _MonteCarloSamplingMixin:
+    """Mixin providing sampling controls for Monte Carlo acquisition functions.
+
+    When any of the controls is set, the base samples used for the Monte Carlo
+    approximation are drawn once from a fixed quasi-random sequence instead of
+    being left to BoTorch's lazily created default sampler. This keeps the
+    acquisition landscape deterministic across evaluations and runs.
+    """
+
+    n_mc_samples: int | None = field(
+        kw_only=True,
+        default=None,
+        validator=optional_v([instance_of(int), gt(0)]),
+    )
+    """Number of Monte Carlo samples used for approximating the acquisition values.
+    When omitted, BoTorch's default sample size is used."""
+
+    sampler_seed: int | None = field(
+        kw_only=True,
+        default=None,
+        validator=optional_v(instance_of(int)),
+    )
+    """Optional seed for drawing the Monte Carlo base samples."""
+
+
 ########################################################################################
 ### Active Learning
 @define(frozen=True)
@@ -56,6 +84,16 @@ class qNegIntegratedPosteriorVariance(AcquisitionFunction):
     )
     """Sampling strategy used for integrating the posterior."""
 
+    _integration_point_cache: dict = field(
+        init=False, factory=dict, eq=False, repr=False
+    )
+    """Cache of farthest point sampling results, keyed by candidate content.
+
+    Farthest point sampling scales quadratically with the number of candidates, yet
+    selects (up to tie breaks) the same points on every call. Caching the selection
+    amortizes the cost across the repeated recommendations of a campaign. Random
+    sampling is deliberately not cached."""
+
     @sampling_fraction.default
     def _default_sampling_fraction(self) -> float | None:
         """If no sampling quantities are provided, use all points by default."""
@@ -79,6 +117,7 @@ class qNegIntegratedPosteriorVariance(AcquisitionFunction):
             flds.sampling_n_points.name,
             flds.sampling_method.name,
             flds.sampling_fraction.name,
+            flds._integration_point_cache.name,
         )
 
     def get_integration_points(self, searchspace: SearchSpace) -> pd.DataFrame:
@@ -99,7 +138,11 @@ class qNegIntegratedPosteriorVariance(AcquisitionFunction):
         """
         # TODO: Move the core logic to `SearchSpace` and ``Subspace*`` classes
 
-        sampled_parts: list[pd.DataFrame] = []
+        # The sampled parts are collected as raw arrays and assembled into a
+        # dataframe only once at the end, avoiding the intermediate index objects
+        # and column copies of a dataframe-based concatenation
+        sampled_parts: list[np.ndarray] = []
+        columns: list[str] = []
         n_candidates: int | None = None
 
         # Discrete part
@@ -109,11 +152,33 @@ class qNegIntegratedPosteriorVariance(AcquisitionFunction):
                 self.sampling_fraction * len(candidates_discrete)  # type: ignore[operator]
             )
 
-            sampled_disc = sample_numerical_df(
-                candidates_discrete, n_candidates, method=self.sampling_method
-            )
+            if self.sampling_method is DiscreteSamplingMethod.FPS:
+                # The deterministic part of the sampling result is reused across
+                # calls operating on the same candidate set
+                cache_key = (
+                    int(pd.util.hash_pandas_object(candidates_discrete).sum()),
+                    candidates_discrete.shape,
+                    n_candidates,
+                )
+                sampled_disc = self._integration_point_cache.get(cache_key)
+                if sampled_disc is None:
+                    sampled_disc = sample_numerical_df(
+                        candidates_discrete,
+                        n_candidates,
+                        method=self.sampling_method,
+                        return_array=True,
+                    )
+                    self._integration_point_cache[cache_key] = sampled_disc
+            else:
+                sampled_disc = sample_numerical_df(
+                    candidates_discrete,
+                    n_candidates,
+                    method=self.sampling_method,
+                    return_array=True,
+                )
 
             sampled_parts.append(sampled_disc)
+            columns.extend(candidates_discrete.columns)
 
         # Continuous part
         if not searchspace.continuous.is_empty:
@@ -127,13 +192,16 @@ class qNegIntegratedPosteriorVariance(AcquisitionFunction):
                 )
             sampled_conti = searchspace.continuous.sample_uniform(n_candidates)
 
-            # Align indices if discrete part is present
-            if len(sampled_parts) > 0:
-                sampled_conti.index = sampled_parts[0].index
-            sampled_parts.append(sampled_conti)
+            sampled_parts.append(sampled_conti.to_numpy())
+            columns.extend(sampled_conti.columns)
 
         # Combine different search space parts
-        result = pd.concat(sampled_parts, axis=1)
+        combined = (
+            sampled_parts[0]
+            if len(sampled_parts) == 1
+            else np.concatenate(sampled_parts, axis=1)
+        )
+        result = pd.DataFrame(combined, columns=columns, copy=False)
 
         return result
 
@@ -178,7 +246,7 @@ class PosteriorStandardDeviation(AcquisitionFunction):
 
 
 @define(frozen=True)
-class qPosteriorStandardDeviation(AcquisitionFunction):
+class qPosteriorStandardDeviation(_MonteCarloSamplingMixin, AcquisitionFunction):
     """Monte Carlo based posterior standard deviation."""
 
     abbreviation: ClassVar[str] = "qPSTD"
@@ -187,7 +255,7 @@ class qPosteriorStandardDeviation(AcquisitionFunction):
 ########################################################################################
 ### Simple Regret
 @define(frozen=True)
-class qSimpleRegret(AcquisitionFunction):
+class qSimpleRegret(_MonteCarloSamplingMixin, AcquisitionFunction):
     """Monte Carlo based simple regret."""
 
     abbreviation: ClassVar[str] = "qSR"
@@ -203,7 +271,7 @@ class ExpectedImprovement(AcquisitionFunction):
 
 
 @define(frozen=True)
-class qExpectedImprovement(AcquisitionFunction):
+class qExpectedImprovement(_MonteCarloSamplingMixin, AcquisitionFunction):
     """Monte Carlo based expected improvement."""
 
     abbreviation: ClassVar[str] = "qEI"
@@ -217,14 +285,14 @@ class LogExpectedImprovement(AcquisitionFunction):
 
 
 @define(frozen=True)
-class qLogExpectedImprovement(AcquisitionFunction):
+class qLogExpectedImprovement(_MonteCarloSamplingMixin, AcquisitionFunction):
     """Logarithmic Monte Carlo based expected improvement."""
 
     abbreviation: ClassVar[str] = "qLogEI"
 
 
 @define(frozen=True)
-class qNoisyExpectedImprovement(AcquisitionFunction):
+class qNoisyExpectedImprovement(_MonteCarloSamplingMixin, AcquisitionFunction):
     """Monte Carlo based noisy expected improvement."""
 
     abbreviation: ClassVar[str] = "qNEI"
@@ -234,7 +302,7 @@ class qNoisyExpectedImprovement(AcquisitionFunction):
 
 
 @define(frozen=True)
-class qLogNoisyExpectedImprovement(AcquisitionFunction):
+class qLogNoisyExpectedImprovement(_MonteCarloSamplingMixin, AcquisitionFunction):
     """Logarithmic Monte Carlo based noisy expected improvement."""
 
     abbreviation: ClassVar[str] = "qLogNEI"
@@ -253,7 +321,7 @@ class ProbabilityOfImprovement(AcquisitionFunction):
 
 
 @define(frozen=True)
-class qProbabilityOfImprovement(AcquisitionFunction):
+class qProbabilityOfImprovement(_MonteCarloSamplingMixin, AcquisitionFunction):
     """Monte Carlo based probability of improvement."""
 
     abbreviation: ClassVar[str] = "qPI"
@@ -280,7 +348,7 @@ class UpperConfidenceBound(AcquisitionFunction):
 
 
 @define(frozen=True)
-class qUpperConfidenceBound(AcquisitionFunction):
+class qUpperConfidenceBound(_MonteCarloSamplingMixin, AcquisitionFunction):
     """Monte Carlo based upper confidence bound."""
 
     abbreviation: ClassVar[str] = "qUCB"
@@ -311,6 +379,10 @@ class qThompsonSampling(qSimpleRegret):
     Thompson sampling using the regular acquisition function machinery.
     """
 
+    sampler_seed: int | None = field(default=None, init=False)
+    """Unavailable for Thompson sampling, whose posterior samples are drawn via the
+    sample shape mechanism above instead of an explicitly constructed sampler."""
+
     @override
     @classproperty
     def _non_botorch_attrs(cls: type[AttrsInstance]) -> tuple[str, ...]:
@@ -326,7 +398,7 @@ class qThompsonSampling(qSimpleRegret):
 ########################################################################################
 ### Pareto Efficient Global Optimization (Chebyshev scalarization of targets)
 @define(frozen=True)
-class qLogNParEGO(AcquisitionFunction):
+class qLogNParEGO(_MonteCarloSamplingMixin, AcquisitionFunction):
     """Pareto optimization via Chebyshev scalarization of the targets."""
 
     abbreviation: ClassVar[str] = "qLogNParEGO"
@@ -339,7 +411,9 @@ class qLogNParEGO(AcquisitionFunction):
 ########################################################################################
 ### Hypervolume Improvement
 @define(frozen=True)
-class _ExpectedHypervolumeImprovement(AcquisitionFunction, ABC):
+class _ExpectedHypervolumeImprovement(
+    _MonteCarloSamplingMixin, AcquisitionFunction, ABC
+):
     """Expected hypervolume improvement base class."""
 
     supports_multi_output: ClassVar[bool] = True
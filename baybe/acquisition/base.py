@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import gc
 from abc import ABC
+from functools import lru_cache
 from typing import TYPE_CHECKING, ClassVar, Literal, overload
 
 import pandas as pd
@@ -159,10 +160,15 @@ class AcquisitionFunction(ABC, SerialMixin):
         return pd.Series(out.numpy(), index=candidates.index)
 
 
+@lru_cache(maxsize=None)
 def _get_botorch_acqf_class(
     baybe_acqf_cls: type[AcquisitionFunction], /
 ) -> type[BotorchAcquisitionFunction]:
-    """Extract the BoTorch acquisition class for the given BayBE acquisition class."""
+    """Extract the BoTorch acquisition class for the given BayBE acquisition class.
+
+    The lookup result is memoized since the class mapping is static and the scan
+    over the BoTorch modules would otherwise be repeated on every recommendation.
+    """
     import botorch
 
     for cls in baybe_acqf_cls.mro():
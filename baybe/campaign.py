@@ -611,7 +611,19 @@ class Campaign(SerialMixin):
 
         # Update metadata
         if self.searchspace.type in (SearchSpaceType.DISCRETE, SearchSpaceType.HYBRID):
-            self._searchspace_metadata.loc[rec.index, _RECOMMENDED] = True
+            # The rows are flagged via a positional numpy scatter, bypassing the slow
+            # general path of pandas' label-based setter. Like the latter, labels
+            # without metadata entry are rejected since they indicate an
+            # inconsistency between recommendation and search space.
+            positions = self._searchspace_metadata.index.get_indexer(rec.index)
+            if (missing := positions < 0).any():
+                raise KeyError(
+                    f"The recommendation contains indices without corresponding "
+                    f"search space metadata entries: {rec.index[missing].tolist()}"
+                )
+            column = self._searchspace_metadata[_RECOMMENDED].to_numpy()
+            column[positions] = True
+            self._searchspace_metadata[_RECOMMENDED] = column
 
         return rec
 
@@ -89,6 +89,12 @@ class BotorchRecommender(BayesianRecommender):
     optimization. **Does not affect purely discrete optimization**.
     """
 
+    max_batch_size: int = field(validator=[instance_of(int), gt(0)], default=2048)
+    """Maximum number of candidates scored jointly per acquisition function call in
+    purely discrete optimization. Bounds the peak memory required for scoring large
+    candidate sets without affecting the result.
+    """
+
     max_n_subspaces: int = field(default=10, validator=[instance_of(int), ge(1)])
     """Threshold defining the maximum number of subspaces to consider for exhaustive
     search in the presence of cardinality constraints. If the combinatorial number of
@@ -144,6 +150,12 @@ class BotorchRecommender(BayesianRecommender):
                 points to be considered.
             batch_size: The size of the recommendation batch.
 
+        Note:
+            Candidate scoring uses GPyTorch's fast predictive variances (LOVE),
+            which approximate the exact posterior variances and can hence minutely
+            alter acquisition values, most notably for variance-driven acquisition
+            functions.
+
         Raises:
             IncompatibleAcquisitionFunctionError: If a non-Monte Carlo acquisition
                 function is used with a batch size > 1.
@@ -164,13 +176,27 @@ class BotorchRecommender(BayesianRecommender):
                 "Thompson sampling currently only supports a batch size of 1."
             )
 
+        import gpytorch.settings
         from botorch.optim import optimize_acqf_discrete
 
         # determine the next set of points to be tested
         candidates_comp = subspace_discrete.transform(candidates_exp)
-        points, _ = optimize_acqf_discrete(
-            self._botorch_acqf, batch_size, to_tensor(candidates_comp)
-        )
+
+        # Fast predictive variances let the model compute its training-data-dependent
+        # caches once on the first evaluation and reuse them across all scored
+        # candidate batches instead of recomputing them for every chunk.
+        # NOTE: Manually caching the cross-covariances K(X_train, X_candidates) on
+        #   top of this brings no further benefit: the candidate set shrinks and the
+        #   pending points grow with every sequential q-batch round, so the blocks
+        #   entering the kernel change between rounds, while all quantities that stay
+        #   fixed are already covered by GPyTorch's prediction caches.
+        with gpytorch.settings.fast_pred_var():
+            points, _ = optimize_acqf_discrete(
+                self._botorch_acqf,
+                batch_size,
+                to_tensor(candidates_comp),
+                max_batch_size=self.max_batch_size,
+            )
 
         # retrieve the index of the points from the input dataframe
         # IMPROVE: The merging procedure is conceptually similar to what
@@ -37,8 +37,15 @@ class MeanPredictionSurrogate(IndependentGaussianSurrogate):
         import torch
 
         # TODO: use target value bounds for covariance scaling when explicitly provided
-        mean = self._model * torch.ones([len(candidates_comp_scaled)])  # type: ignore[operator]
-        var = torch.ones(len(candidates_comp_scaled))
+        # A single `full` call fuses allocation and fill, avoiding the extra
+        # elementwise kernel of a scalar broadcast-multiply
+        mean = torch.full(
+            (candidates_comp_scaled.shape[-2],),
+            self._model,  # type: ignore[arg-type]
+            dtype=candidates_comp_scaled.dtype,
+            device=candidates_comp_scaled.device,
+        )
+        var = torch.ones_like(mean)
         return mean, var
 
     @override
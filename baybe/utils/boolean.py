@@ -6,8 +6,10 @@ from typing import Any
 from attrs import cmp_using
 from typing_extensions import is_protocol
 
-# Used for comparing pandas dataframes in attrs classes
-eq_dataframe = cmp_using(lambda x, y: x.equals(y))
+# Used for comparing pandas dataframes in attrs classes. The identity shortcut
+# skips the element-wise comparison in the common case where both objects hold
+# a reference to the very same dataframe.
+eq_dataframe = cmp_using(lambda x, y: x is y or x.equals(y))
 
 
 def is_abstract(cls: Any) -> bool:
@@ -33,9 +33,40 @@ def _dummy_wrapper(func):
     return func
 
 
-_disk_cache = (
-    _dummy_wrapper if _cachedir == "" else Memory(Path(_cachedir), verbose=0).cache
-)
+_memory = None if _cachedir == "" else Memory(Path(_cachedir), verbose=0)
+_disk_cache = _dummy_wrapper if _memory is None else _memory.cache
+
+_PARALLEL_FINGERPRINT_THRESHOLD = 1000
+"""Minimum batch size above which fingerprint computation is parallelized across
+cores. Below this threshold, the worker startup overhead outweighs the gains."""
+
+
+_ssl_context = ssl.create_default_context()
+_ssl_context.check_hostname = False
+_ssl_context.verify_mode = ssl.CERT_NONE
+
+
+@lru_cache(maxsize=4096)
+@_disk_cache
+def _fetch_smiles_from_cir(name: str) -> str:
+    """Query the chemical identifier resolver for the given normalized name.
+
+    Results are cached in memory and on disk so that repeated lookups of the same
+    compound name, e.g. across campaign runs, skip the network entirely. Network
+    failures propagate as exceptions and are hence not cached.
+
+    Args:
+        name: URL-normalized name or nickname of compound.
+
+    Returns:
+        SMILES string corresponding to the chemical name, or an empty string if the
+        name could not be resolved.
+    """
+    url = "http://cactus.nci.nih.gov/chemical/structure/" + name + "/smiles"
+    with urllib.request.urlopen(url, context=_ssl_context, timeout=10) as web:
+        smiles = web.read().decode("utf8")
+
+    return "" if "</div>" in smiles else smiles
 
 
 def name_to_smiles(name: str) -> str:
@@ -51,36 +82,46 @@ def name_to_smiles(name: str) -> str:
     Returns:
         SMILES string corresponding to chemical name.
     """
-    name = name.replace(" ", "%20")
-
     try:
-        url = "http://cactus.nci.nih.gov/chemical/structure/" + name + "/smiles"
-        ctx = ssl.create_default_context()
-        ctx.check_hostname = False
-        ctx.verify_mode = ssl.CERT_NONE
+        return _fetch_smiles_from_cir(name.replace(" ", "%20"))
+    except Exception:
+        return ""
 
-        with urllib.request.urlopen(url, context=ctx) as web:
-            smiles = web.read().decode("utf8")
 
-        smiles = str(smiles)
-        if "</div>" in smiles:
-            return ""
+def _encoder_config_key(encoder: BaseFingerprintTransformer) -> tuple:
+    """Create a deterministic, cheap-to-hash key for the encoder configuration."""
+    params = encoder.get_params()
 
-        return smiles
+    # Execution settings do not affect the computed features
+    for setting in ("n_jobs", "batch_size", "verbose"):
+        params.pop(setting, None)
 
-    except Exception:
-        return ""
+    return (
+        type(encoder).__name__,
+        tuple(sorted((name, repr(value)) for name, value in params.items())),
+    )
 
 
-@lru_cache(maxsize=None)
-@_disk_cache
-def _molecule_to_fingerprint_features(
+def _molecule_key(molecule: str | Chem.Mol) -> str | bytes:
+    """Create a content-based cache key for the given molecule."""
+    return molecule if isinstance(molecule, str) else molecule.ToBinary()
+
+
+def _compute_fingerprint_features(
+    config_key: tuple,
+    molecule_key: str | bytes,
     molecule: str | Chem.Mol,
     encoder: BaseFingerprintTransformer,
 ) -> np.ndarray:
     """Compute molecular fingerprint for a single molecule.
 
+    The disk cache is keyed exclusively on the two content-based key arguments.
+    This avoids hashing the (potentially large) encoder object on every call and
+    yields cache hits across logically identical encoder instances and processes.
+
     Args:
+        config_key: Content key of the encoder, see :func:`_encoder_config_key`.
+        molecule_key: Content key of the molecule, see :func:`_molecule_key`.
         molecule: SMILES string or molecule object.
         encoder: Instance of the fingerprint class to be used for computation.
 
@@ -90,6 +131,78 @@ def _molecule_to_fingerprint_features(
     return encoder.transform([molecule])
 
 
+if _memory is not None:
+    _compute_fingerprint_features = _memory.cache(  # type: ignore[assignment]
+        _compute_fingerprint_features, ignore=["molecule", "encoder"]
+    )
+
+
+_fingerprint_memory_cache: dict[tuple, np.ndarray] = {}
+"""In-memory cache of fingerprints, keyed by encoder and molecule content."""
+
+
+def _fingerprint_from_cache(
+    cache_key: tuple,
+    molecule: str | Chem.Mol,
+    encoder: BaseFingerprintTransformer,
+) -> np.ndarray | None:
+    """Retrieve the fingerprint for the given cache key, if available."""
+    from joblib.memory import MemorizedFunc
+
+    if (features := _fingerprint_memory_cache.get(cache_key)) is not None:
+        return features
+    if isinstance(
+        _compute_fingerprint_features, MemorizedFunc
+    ) and _compute_fingerprint_features.check_call_in_cache(
+        *cache_key, molecule, encoder
+    ):
+        features = _compute_fingerprint_features(*cache_key, molecule, encoder)
+        _fingerprint_memory_cache[cache_key] = features
+        return features
+    return None
+
+
+def _store_fingerprint_on_disk(cache_key: tuple, features: np.ndarray) -> None:
+    """Persist an externally computed fingerprint in the disk cache."""
+    from joblib.memory import MemorizedFunc
+
+    if not isinstance(_compute_fingerprint_features, MemorizedFunc):
+        return
+
+    # NOTE: There is no public interface for populating the cache without invoking
+    #   the memorized function, so the call identifier is assembled manually. The
+    #   ignored arguments still need to be provided for signature binding.
+    call_id = (
+        _compute_fingerprint_features.func_id,
+        _compute_fingerprint_features._get_args_id(*cache_key, None, None),
+    )
+    _compute_fingerprint_features.store_backend.dump_item(call_id, features, verbose=0)
+
+
+def _molecule_to_fingerprint_features(
+    molecule: str | Chem.Mol,
+    encoder: BaseFingerprintTransformer,
+) -> np.ndarray:
+    """Compute molecular fingerprint for a single molecule.
+
+    The result is cached in memory and on disk, keyed by the encoder and molecule
+    content rather than their object identities.
+
+    Args:
+        molecule: SMILES string or molecule object.
+        encoder: Instance of the fingerprint class to be used for computation.
+
+    Returns:
+        Array of fingerprint features.
+    """
+    cache_key = (_encoder_config_key(encoder), _molecule_key(molecule))
+    if (features := _fingerprint_from_cache(cache_key, molecule, encoder)) is not None:
+        return features
+    features = _compute_fingerprint_features(*cache_key, molecule, encoder)
+    _fingerprint_memory_cache[cache_key] = features
+    return features
+
+
 def smiles_to_fingerprint_features(
     smiles: Sequence[str],
     encoding: SubstanceEncoding,
@@ -109,7 +222,9 @@ def smiles_to_fingerprint_features(
     Returns:
         Dataframe containing fingerprints for each SMILES string.
     """
-    kwargs_fingerprint = kwargs_fingerprint or {}
+    # Copy the fingerprint settings since they may be modified below and the
+    # mutations must not leak into the caller's dict
+    kwargs_fingerprint = dict(kwargs_fingerprint) if kwargs_fingerprint else {}
     kwargs_conformer = kwargs_conformer or {}
 
     if encoding is SubstanceEncoding.MORGAN_FP:
@@ -132,6 +247,14 @@ def smiles_to_fingerprint_features(
         encoding = SubstanceEncoding.RDKIT2DDESCRIPTORS
 
     fingerprint_cls = get_fingerprint_class(encoding)
+
+    # Parallelize the batch computation across cores, unless the caller made an
+    # explicit choice
+    if "n_jobs" not in kwargs_fingerprint and (
+        len(smiles) >= _PARALLEL_FINGERPRINT_THRESHOLD
+    ):
+        kwargs_fingerprint["n_jobs"] = -1
+
     fingerprint_encoder = fingerprint_cls(**kwargs_fingerprint)
 
     if fingerprint_encoder.requires_conformers:
@@ -141,12 +264,46 @@ def smiles_to_fingerprint_features(
     else:
         mol_list = smiles
 
-    features = np.concatenate(
-        [
-            _molecule_to_fingerprint_features(mol, fingerprint_encoder)
-            for mol in mol_list
-        ]
-    )
+    # Serve molecules with cached fingerprints and compute all remaining
+    # fingerprints in a single vectorized batch call
+    config_key = _encoder_config_key(fingerprint_encoder)
+    hit_positions: list[int] = []
+    hit_rows: list[np.ndarray] = []
+    miss_positions: list[int] = []
+    miss_molecules: list[str | Chem.Mol] = []
+    miss_keys: list[tuple] = []
+    for position, mol in enumerate(mol_list):
+        cache_key = (config_key, _molecule_key(mol))
+        row = _fingerprint_from_cache(cache_key, mol, fingerprint_encoder)
+        if row is not None:
+            hit_positions.append(position)
+            hit_rows.append(row)
+        else:
+            miss_positions.append(position)
+            miss_molecules.append(mol)
+            miss_keys.append(cache_key)
+
+    # Both cached and batch-computed rows are packed via a single fancy-index
+    # scatter each, keeping the row placement out of the Python loop
+    features: np.ndarray | None = None
+    if miss_molecules:
+        batch = fingerprint_encoder.transform(miss_molecules)
+        features = np.empty((len(mol_list), batch.shape[1]), dtype=DTypeFloatNumpy)
+        features[miss_positions, :] = batch
+
+        # Make the batch-computed fingerprints available to future calls and runs
+        for row_number, cache_key in enumerate(miss_keys):
+            row = batch[row_number : row_number + 1]
+            _fingerprint_memory_cache[cache_key] = row
+            _store_fingerprint_on_disk(cache_key, row)
+    if hit_rows:
+        if features is None:
+            features = np.empty(
+                (len(mol_list), hit_rows[0].shape[1]), dtype=DTypeFloatNumpy
+            )
+        features[hit_positions, :] = np.concatenate(hit_rows, axis=0)
+    assert features is not None
+
     name = f"{encoding.name}_"
     prefix = prefix + "_" if prefix else ""
     feature_names_out = fingerprint_encoder.get_feature_names_out()
@@ -156,11 +313,20 @@ def smiles_to_fingerprint_features(
         for f in feature_names_out
     ]
     col_names = [prefix + name + suffix for suffix in suffixes]
-    df = pd.DataFrame(features, columns=col_names, dtype=DTypeFloatNumpy)
+
+    # The feature buffer is already of the target dtype, so the dataframe can wrap
+    # it directly without an additional cast/copy
+    df = pd.DataFrame(features, columns=col_names, copy=False)
 
     return df
 
 
+_FINGERPRINT_CLASS_NAMES: dict[str, str] = {
+    name.casefold(): name for name in dir(fingerprints) if name.endswith("Fingerprint")
+}
+"""Lookup table mapping casefolded fingerprint class names to their actual names."""
+
+
 def get_fingerprint_class(encoding: SubstanceEncoding) -> BaseFingerprintTransformer:
     """Retrieve the fingerprint class corresponding to a given encoding.
 
@@ -178,21 +344,24 @@ def get_fingerprint_class(encoding: SubstanceEncoding) -> BaseFingerprintTransfo
         return fingerprints.RDKitFingerprint
 
     try:
-        cls_name = next(
-            name
-            for name in dir(fingerprints)
-            if (encoding.name + "Fingerprint").casefold() == name.casefold()
-        )
-    except StopIteration as e:
+        cls_name = _FINGERPRINT_CLASS_NAMES[(encoding.name + "Fingerprint").casefold()]
+    except KeyError as e:
         raise ValueError(
             f"No fingerprint class exists for the specified encoding '{encoding.name}'."
         ) from e
     return getattr(fingerprints, cls_name)
 
 
+_smiles_cache_size = int(os.environ.get("BAYBE_SMILES_CACHE_SIZE", "8192"))
+"""Maximum number of canonical SMILES representations cached in memory."""
+
+
+@lru_cache(maxsize=_smiles_cache_size)
 def get_canonical_smiles(smiles: str) -> str:
     """Return the "canonical" representation of the given SMILES."""
-    try:
-        return Chem.MolToSmiles(Chem.MolFromSmiles(smiles))
-    except Exception:
+    # NOTE: `MolFromSmiles` signals invalid SMILES by returning `None` instead of
+    #   raising, so an explicit check is both required and cheaper than routing the
+    #   subsequent failure through exception handling
+    if (molecule := Chem.MolFromSmiles(smiles)) is None:
         raise ValueError(f"The SMILES '{smiles}' does not appear to be valid.")
+    return Chem.MolToSmiles(molecule)
@@ -69,9 +69,14 @@ def to_tensor(*x: _ConvertibleToTensor) -> Tensor | tuple[Tensor, ...]:
                 # subsequent numpy-to-torch conversion to fail. This happens, for
                 # example, when the dataframe contains Boolean and integer columns.
 
+                # The conversion happens only once and the strides of the resulting
+                # array are inspected afterwards, avoiding a second full
+                # materialization just for the stride check
+                array = x.to_numpy(numpy_dtype)
+
                 # tensors with negative strides are not supported by PyTorch
-                fix_strides = any(s < 0 for s in x.to_numpy().strides)
-                array = x.to_numpy(numpy_dtype, copy=fix_strides)
+                if any(s < 0 for s in array.strides):
+                    array = np.ascontiguousarray(array)
                 tensor = torch.from_numpy(array)
             case _:
                 assert_never(x)
@@ -186,7 +186,8 @@ def sample_numerical_df(
     n_points: int,
     *,
     method: DiscreteSamplingMethod = DiscreteSamplingMethod.Random,
-) -> pd.DataFrame:
+    return_array: bool = False,
+) -> pd.DataFrame | np.ndarray:
     """Sample data points from a numerical dataframe.
 
     If the requested amount of points is larger than the number of available points,
@@ -197,6 +198,8 @@ def sample_numerical_df(
         df: Dataframe with purely numerical entries.
         n_points: Number of points to sample.
         method: Sampling method.
+        return_array: If ``True``, the sampled points are returned as a raw numpy
+            array, bypassing the index machinery of the dataframe-based return path.
 
     Returns:
         The sampled points.
@@ -223,4 +226,6 @@ def sample_numerical_df(
         else:
             raise ValueError(f"Unrecognized sampling method: '{method}'.")
 
+    if return_array:
+        return df.values[ilocs]
     return df.iloc[ilocs]
@@ -24,6 +24,25 @@ class ColumnTransformer:
     _is_trained: bool = field(default=False, init=False)
     """Boolean indicating if the transformer has been trained."""
 
+    _permutation: Tensor = field(default=None, init=False, eq=False, repr=False)
+    """Index tensor gathering all transformed columns into one contiguous block."""
+
+    _group_slices: list[slice] = field(default=None, init=False, eq=False, repr=False)
+    """Slices delimiting the column groups in the permuted layout."""
+
+    def __attrs_post_init__(self) -> None:
+        import torch
+
+        # Precompute the permuted column layout so that `transform` can apply each
+        # transformer to a contiguous block of a single gathered tensor
+        self._permutation = torch.tensor(
+            [col for group in self.mapping for col in group], dtype=torch.long
+        )
+        bounds = itertools.accumulate((len(group) for group in self.mapping), initial=0)
+        self._group_slices = [
+            slice(start, stop) for start, stop in itertools.pairwise(bounds)
+        ]
+
     @mapping.validator
     def _validate_mapping_types_lazily(self, attr, value):
         """Perform transform ``isinstance`` check using lazy import."""
@@ -41,11 +60,15 @@ class ColumnTransformer:
     @mapping.validator
     def _validate_mapping_is_disjoint(self, _, value: dict):
         """Validate that the each column is assigned to at most one transformer."""
-        for x, y in itertools.combinations(value.keys(), 2):
-            if not set(x).isdisjoint(y):
-                raise ValueError(
-                    f"The provided column specifications {x} and {y} are not disjoint."
-                )
+        seen: dict[int, tuple[int, ...]] = {}
+        for cols in value.keys():
+            for col in cols:
+                if (other := seen.get(col)) is not None:
+                    raise ValueError(
+                        f"The provided column specifications {other} and {cols} "
+                        f"are not disjoint: column {col} appears in both."
+                    )
+                seen[col] = cols
 
     def fit(self, x: Tensor, /) -> None:
         """Fit the transformer to the given tensor."""
@@ -66,9 +89,16 @@ class ColumnTransformer:
                 f"The {self.__class__.__name__} must be trained before it can be used."
             )
 
+        # Gather all transformed columns once, apply the transformers on contiguous
+        # slices of the gathered block, and scatter the results back in a single pass.
+        # Compared to per-group advanced indexing, this avoids allocating one
+        # temporary per group for both the read and the write access.
+        x_perm = x.index_select(-1, self._permutation)
+        for slc, transformer in zip(self._group_slices, self.mapping.values()):
+            x_perm[..., slc] = transformer(x_perm[..., slc])
+
         out = x.clone()
-        for cols, transformer in self.mapping.items():
-            out[..., cols] = transformer(out[..., cols])
+        out.index_copy_(-1, self._permutation, x_perm)
         return out
 
 
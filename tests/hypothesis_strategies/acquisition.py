@@ -25,6 +25,12 @@ from baybe.acquisition import (
 from baybe.utils.sampling_algorithms import DiscreteSamplingMethod
 from tests.hypothesis_strategies.basic import finite_floats
 
+n_mc_samples = st.one_of(st.none(), st.integers(min_value=1, max_value=1024))
+"""A strategy for the Monte Carlo sample count of acquisition functions."""
+
+sampler_seeds = st.one_of(st.none(), st.integers(min_value=0, max_value=2**32 - 1))
+"""A strategy for the Monte Carlo sampler seed of acquisition functions."""
+
 
 @st.composite
 def _qNIPV_strategy(draw: st.DrawFn):
@@ -61,27 +67,56 @@ acquisition_functions = st.one_of(
     st.builds(UpperConfidenceBound, beta=finite_floats()),
     st.builds(PosteriorMean),
     st.builds(PosteriorStandardDeviation, maximize=st.sampled_from([True, False])),
-    st.builds(qPosteriorStandardDeviation),
+    st.builds(
+        qPosteriorStandardDeviation,
+        n_mc_samples=n_mc_samples,
+        sampler_seed=sampler_seeds,
+    ),
     st.builds(LogExpectedImprovement),
-    st.builds(qExpectedImprovement),
-    st.builds(qProbabilityOfImprovement),
-    st.builds(qUpperConfidenceBound, beta=finite_floats()),
-    st.builds(qSimpleRegret),
-    st.builds(qLogExpectedImprovement),
+    st.builds(
+        qExpectedImprovement, n_mc_samples=n_mc_samples, sampler_seed=sampler_seeds
+    ),
+    st.builds(
+        qProbabilityOfImprovement, n_mc_samples=n_mc_samples, sampler_seed=sampler_seeds
+    ),
+    st.builds(
+        qUpperConfidenceBound,
+        beta=finite_floats(),
+        n_mc_samples=n_mc_samples,
+        sampler_seed=sampler_seeds,
+    ),
+    st.builds(qSimpleRegret, n_mc_samples=n_mc_samples, sampler_seed=sampler_seeds),
+    st.builds(
+        qLogExpectedImprovement, n_mc_samples=n_mc_samples, sampler_seed=sampler_seeds
+    ),
     st.builds(
         qKnowledgeGradient, num_fantasies=st.integers(min_value=1, max_value=512)
     ),
-    st.builds(qNoisyExpectedImprovement, prune_baseline=st.booleans()),
-    st.builds(qLogNoisyExpectedImprovement, prune_baseline=st.booleans()),
+    st.builds(
+        qNoisyExpectedImprovement,
+        prune_baseline=st.booleans(),
+        n_mc_samples=n_mc_samples,
+        sampler_seed=sampler_seeds,
+    ),
+    st.builds(
+        qLogNoisyExpectedImprovement,
+        prune_baseline=st.booleans(),
+        n_mc_samples=n_mc_samples,
+        sampler_seed=sampler_seeds,
+    ),
     _qNIPV_strategy(),
     st.builds(
         qNoisyExpectedHypervolumeImprovement,
         prune_baseline=st.booleans(),
         reference_point=_reference_points(),
+        n_mc_samples=n_mc_samples,
+        sampler_seed=sampler_seeds,
     ),
     st.builds(
         qLogNoisyExpectedHypervolumeImprovement,
         prune_baseline=st.booleans(),
         reference_point=_reference_points(),
+        n_mc_samples=n_mc_samples,
+        sampler_seed=sampler_seeds,
     ),
 )
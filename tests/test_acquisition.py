@@ -1,8 +1,19 @@
 """Acquisition function tests."""
 
+import pandas as pd
+import pytest
+import torch
 from hypothesis import given
 
+from baybe.acquisition import qExpectedImprovement, qThompsonSampling
+from baybe.acquisition.base import AcquisitionFunction
+from baybe.objectives import SingleTargetObjective
+from baybe.parameters import NumericalDiscreteParameter
 from baybe.recommenders import BotorchRecommender
+from baybe.searchspace import SearchSpace
+from baybe.surrogates import GaussianProcessSurrogate
+from baybe.targets import NumericalTarget
+from baybe.utils.basic import get_subclasses
 from tests.hypothesis_strategies.acquisition import acquisition_functions
 
 
@@ -10,3 +21,43 @@ from tests.hypothesis_strategies.acquisition import acquisition_functions
 def test_acqfs(acqf):
     """Test all acquisition functions with sequential greedy recommender."""
     BotorchRecommender(acquisition_function=acqf)
+
+
+def test_mc_sampling_controls():
+    """The sampling controls yield a seeded sampler and reproducible recommendations."""
+    from botorch.sampling.normal import SobolQMCNormalSampler
+
+    searchspace = SearchSpace.from_product(
+        [NumericalDiscreteParameter("p", (0.0, 1.0, 2.0, 3.0))]
+    )
+    objective = SingleTargetObjective(NumericalTarget("t"))
+    measurements = pd.DataFrame({"p": [0.0, 1.0, 2.0], "t": [0.3, 0.1, 0.2]})
+
+    acqf = qExpectedImprovement(n_mc_samples=16, sampler_seed=1337)
+    surrogate = GaussianProcessSurrogate()
+    surrogate.fit(searchspace, objective, measurements)
+    botorch_acqf = acqf.to_botorch(surrogate, searchspace, objective, measurements)
+
+    assert isinstance(botorch_acqf.sampler, SobolQMCNormalSampler)
+    assert botorch_acqf.sampler.sample_shape == torch.Size([16])
+    assert botorch_acqf.sampler.seed == 1337
+
+    recommender = BotorchRecommender(acquisition_function=acqf)
+    rec = recommender.recommend(2, searchspace, objective, measurements)
+    assert rec.equals(recommender.recommend(2, searchspace, objective, measurements))
+
+
+def test_thompson_sampling_rejects_sampler_seed():
+    """Thompson sampling does not expose the seed of its posterior sampling."""
+    with pytest.raises(TypeError):
+        qThompsonSampling(sampler_seed=0)
+
+
+def test_acqfs_are_slotted():
+    """Acquisition functions carry no instance dictionary.
+
+    A fresh acquisition function is created per recommendation, so the classes are
+    expected to remain slotted throughout the entire hierarchy.
+    """
+    for cls in get_subclasses(AcquisitionFunction):
+        assert not hasattr(cls(), "__dict__"), cls.__name__
@@ -3,11 +3,12 @@
 
 from contextlib import nullcontext
 
+import pandas as pd
 import pytest
 from botorch.exceptions import UnsupportedError
 from pytest import param
 
-from baybe.acquisition import qKG, qNIPV, qTS, qUCB
+from baybe.acquisition import qKG, qLogEI, qNIPV, qTS, qUCB
 from baybe.acquisition.base import AcquisitionFunction
 from baybe.exceptions import (
     InvalidSurrogateModelError,
@@ -26,7 +27,9 @@ from baybe.kernels.basic import (
     RQKernel,
 )
 from baybe.kernels.composite import AdditiveKernel, ProductKernel, ScaleKernel
+from baybe.objectives import SingleTargetObjective
 from baybe.objectives.pareto import ParetoObjective
+from baybe.parameters import NumericalDiscreteParameter
 from baybe.priors import (
     GammaPrior,
     HalfCauchyPrior,
@@ -44,7 +47,7 @@ from baybe.recommenders.pure.bayesian.botorch import (
     BotorchRecommender,
 )
 from baybe.recommenders.pure.nonpredictive.base import NonPredictiveRecommender
-from baybe.searchspace import SearchSpaceType
+from baybe.searchspace import SearchSpace, SearchSpaceType
 from baybe.surrogates.bandit import BetaBernoulliMultiArmedBanditSurrogate
 from baybe.surrogates.base import IndependentGaussianSurrogate, Surrogate
 from baybe.surrogates.custom import CustomONNXSurrogate
@@ -411,3 +414,23 @@ def test_meta_recommenders(campaign, n_iterations, batch_size):
 @pytest.mark.parametrize("batch_size", [1], ids=["b1"])
 def test_multi_armed_bandit(campaign, n_iterations, batch_size):
     run_iterations(campaign, n_iterations, batch_size, add_noise=False)
+
+
+def test_max_batch_size_invariance():
+    """Tiling the discrete candidate evaluation does not change the result."""
+    searchspace = SearchSpace.from_product(
+        [NumericalDiscreteParameter(f"p{i}", (0.0, 1.0, 2.0, 3.0)) for i in range(2)]
+    )
+    objective = SingleTargetObjective(NumericalTarget("t"))
+    measurements = pd.DataFrame(
+        {"p0": [0.0, 1.0, 2.0], "p1": [1.0, 0.0, 3.0], "t": [0.3, 0.1, 0.2]}
+    )
+    acqf = qLogEI(sampler_seed=0)
+
+    untiled, tiled = (
+        BotorchRecommender(
+            acquisition_function=acqf, max_batch_size=max_batch_size
+        ).recommend(2, searchspace, objective, measurements)
+        for max_batch_size in (2048, 3)
+    )
+    assert untiled.equals(tiled)